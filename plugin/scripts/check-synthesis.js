@@ -3,11 +3,42 @@
  * SessionStart hook script for claude-code-memory.
  * Checks if memory synthesis is needed and triggers it if overdue.
  */
-const { spawn } = require('child_process');
-const path = require('path');
-const { getMemoryDir, ensureDirs, loadConfig, getLastSynthesisTime, countPendingSessions } = require('./memory-utils');
+// Only fs is loaded up front: the fast path below decides most session
+// starts with a single stat, so child_process, path and the shared
+// utils are required lazily on the slow path only.
+const fs = require('fs');
+
+// Fast-path threshold matching the default synthesis_interval_hours.
+// Intervals configured shorter than this take effect on the slow path
+// once the default window has elapsed.
+const DEFAULT_INTERVAL_MS = 24 * 60 * 60 * 1000;
+
+/**
+ * Fast path: one stat on the state file. The state file is rewritten
+ * at every synthesis, so if its mtime is within the interval nothing
+ * can be due — no config parsing, no mkdirs, no session scan.
+ */
+function isSynthesisFresh() {
+  const claudeHome = process.env.CLAUDE_HOME || require('os').homedir() + '/.claude';
+  try {
+    const age = Date.now() - fs.statSync(claudeHome + '/memory/synthesis/last-synthesis.json').mtimeMs;
+    return age < DEFAULT_INTERVAL_MS;
+  } catch {
+    // No state file yet — take the full check
+    return false;
+  }
+}
 
 function main() {
+  if (isSynthesisFresh()) {
+    return 0;
+  }
+
+  // Slow path — load the heavier modules only now
+  const { spawn } = require('child_process');
+  const path = require('path');
+  const { getMemoryDir, ensureDirs, loadConfig, getLastSynthesisTime, countPendingSessions } = require('./memory-utils');
+
   const memoryDir = getMemoryDir();
   const sessionsDir = path.join(memoryDir, 'sessions');
   const synthesisDir = path.join(memoryDir, 'synthesis');
@@ -25,12 +25,13 @@ const DEFAULT_CONFIG = {
  * Get the Claude home directory.
  * Respects CLAUDE_HOME env var, defaults to ~/.claude
  */
+let cachedClaudeHome = null;
+
 function getClaudeHome() {
-  const claudeHome = process.env.CLAUDE_HOME;
-  if (claudeHome) {
-    return claudeHome;
+  if (cachedClaudeHome === null) {
+    cachedClaudeHome = process.env.CLAUDE_HOME || path.join(os.homedir(), '.claude');
   }
-  return path.join(os.homedir(), '.claude');
+  return cachedClaudeHome;
 }
 
 /**
@@ -54,19 +55,31 @@ function ensureDirs(memoryDir) {
   }
 }
 
+// Parsed config cache keyed by absolute path and mtime: repeated
+// loadConfig calls in the same process skip the read and parse when
+// the file hasn't changed.
+const configCache = new Map();
+
 /**
  * Load memory configuration with defaults fallback.
+ * Callers always get a fresh merged object, so mutating the result
+ * never leaks into the cache.
  */
 function loadConfig(memoryDir) {
   const configFile = path.join(memoryDir, 'memory-config.json');
   try {
-    if (fs.existsSync(configFile)) {
-      const raw = fs.readFileSync(configFile, 'utf-8');
-      const config = JSON.parse(raw);
-      return { ...DEFAULT_CONFIG, ...config };
+    const mtimeNs = fs.statSync(configFile, { bigint: true }).mtimeNs;
+    const cached = configCache.get(configFile);
+    if (cached && cached.mtimeNs === mtimeNs) {
+      return { ...DEFAULT_CONFIG, ...cached.config };
     }
+
+    // Buffer read straight into JSON.parse, no separate decode step
+    const config = JSON.parse(fs.readFileSync(configFile));
+    configCache.set(configFile, { mtimeNs, config });
+    return { ...DEFAULT_CONFIG, ...config };
   } catch {
-    // Fall through to defaults
+    // Missing or invalid config — fall through to defaults
   }
   return { ...DEFAULT_CONFIG };
 }
@@ -77,30 +90,41 @@ function loadConfig(memoryDir) {
 function getLastSynthesisTime(synthesisDir) {
   const stateFile = path.join(synthesisDir, 'last-synthesis.json');
   try {
-    if (fs.existsSync(stateFile)) {
-      const raw = fs.readFileSync(stateFile, 'utf-8');
-      const state = JSON.parse(raw);
-      return new Date(state.last_synthesis);
-    }
+    const state = JSON.parse(fs.readFileSync(stateFile));
+    return new Date(state.last_synthesis);
   } catch {
-    // Fall through
+    // Missing or invalid state file
   }
   return null;
 }
 
 /**
  * Count session_*.json files in the sessions directory.
+ * Streams entries with opendirSync so no intermediate arrays are built
+ * and no extra stat calls are made.
  */
 function countPendingSessions(sessionsDir) {
+  let dir;
   try {
-    if (!fs.existsSync(sessionsDir)) {
-      return 0;
-    }
-    const files = fs.readdirSync(sessionsDir);
-    return files.filter(f => f.startsWith('session_') && f.endsWith('.json')).length;
+    dir = fs.opendirSync(sessionsDir);
   } catch {
     return 0;
   }
+
+  let count = 0;
+  try {
+    let entry;
+    while ((entry = dir.readSync()) !== null) {
+      if (entry.name.startsWith('session_') && entry.name.endsWith('.json')) {
+        count++;
+      }
+    }
+  } catch {
+    // Partial count is fine
+  } finally {
+    dir.closeSync();
+  }
+  return count;
 }
 
 /**
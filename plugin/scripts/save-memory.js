@@ -9,22 +9,14 @@
  */
 const fs = require('fs');
 const path = require('path');
-const { execSync } = require('child_process');
 const { getMemoryDir, ensureDirs, loadConfig, readStdin, formatTimestamp, findTranscriptPath } = require('./memory-utils');
 
 const MAX_CONVERSATION_BYTES = 50000; // ~15K tokens, well within Haiku's context
 const MAX_MEMORIES = 15;
 
 async function main() {
-  const memoryDir = getMemoryDir();
-  const sessionsDir = path.join(memoryDir, 'sessions');
-
-  ensureDirs(memoryDir);
-
-  const config = loadConfig(memoryDir);
-  if (!config.enabled) return 0;
-
-  // Read hook input from stdin
+  // Read hook input first: empty stdin means there is nothing to do,
+  // so skip config loading and directory creation entirely
   let hookInput;
   try {
     hookInput = await readStdin();
@@ -33,6 +25,14 @@ async function main() {
     return 1;
   }
 
+  const memoryDir = getMemoryDir();
+  const sessionsDir = path.join(memoryDir, 'sessions');
+
+  const config = loadConfig(memoryDir);
+  if (!config.enabled) return 0;
+
+  ensureDirs(memoryDir);
+
   // Parse stdin
   let hookData;
   try {
@@ -95,15 +95,29 @@ async function main() {
 
   if (!memories.length) return 0;
 
-  // Validate and save
+  // Validate and save — single pass with the category check hoisted,
+  // stopping at the cap and skipping String() copies for values that
+  // are already strings
   const validCategories = new Set(config.categories || []);
-  const validMemories = memories.filter(mem =>
-    mem && typeof mem === 'object' && mem.category && mem.content &&
-    (!validCategories.size || validCategories.has(mem.category))
-  ).map(mem => ({
-    category: String(mem.category),
-    content: String(mem.content).slice(0, 200)
-  })).slice(0, MAX_MEMORIES);
+  const checkCategory = validCategories.size
+    ? (c => validCategories.has(c))
+    : (() => true);
+
+  const validMemories = [];
+  for (const mem of memories) {
+    if (validMemories.length >= MAX_MEMORIES) break;
+    if (!mem || typeof mem !== 'object') continue;
+
+    let category = mem.category;
+    let content = mem.content;
+    if (!category || !content) continue;
+
+    if (typeof category !== 'string') category = String(category);
+    if (!checkCategory(category)) continue;
+    if (typeof content !== 'string') content = String(content);
+
+    validMemories.push({ category, content: content.slice(0, 200) });
+  }
 
   if (!validMemories.length) return 0;
 
@@ -322,6 +336,10 @@ function extractAssistantText(content) {
  * Pipes conversation text via stdin using execSync's input option.
  */
 async function tryAIExtraction(conversationText) {
+  // Required lazily — child_process is only needed when AI extraction
+  // actually runs, not on the skip paths
+  const { execSync } = require('child_process');
+
   const prompt = 'Extract up to 10 memorable facts about the user from the conversation provided on stdin. Each must be a short factual statement (under 200 chars) in one of these categories: work_context, preferences, technical_style, ongoing_projects, tools_and_workflows. Only extract what the USER explicitly stated. Return ONLY valid JSON: {"memories":[{"category":"...","content":"..."}]}';
 
   try {
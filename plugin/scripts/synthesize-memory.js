@@ -5,7 +5,7 @@
  */
 const fs = require('fs');
 const path = require('path');
-const { getMemoryDir, loadConfig } = require('./memory-utils');
+const { getMemoryDir, loadConfig, formatTimestamp } = require('./memory-utils');
 
 const CATEGORY_ORDER = [
   'work_context',
@@ -23,43 +23,208 @@ const CATEGORY_NAMES = {
   tools_and_workflows: 'Tools & Workflows'
 };
 
+// Memoized: categories repeat across memories, so each display name is
+// computed at most once per run
+const categoryNameCache = Object.create(null);
+
 function formatCategoryName(category) {
-  return CATEGORY_NAMES[category] || category.replace(/_/g, ' ').replace(/\b\w/g, c => c.toUpperCase());
+  let name = categoryNameCache[category];
+  if (name === undefined) {
+    name = CATEGORY_NAMES[category] || category.replace(/_/g, ' ').replace(/\b\w/g, c => c.toUpperCase());
+    categoryNameCache[category] = name;
+  }
+  return name;
 }
 
+// Two memories are near-duplicates when their token sets overlap with
+// at least this Jaccard similarity.
+const JACCARD_THRESHOLD = 0.7;
+
 /**
- * Load all session memory files.
+ * Word-token set of a content string, for Jaccard comparison.
  */
-function loadSessionMemories(sessionsDir) {
-  const memories = [];
+function tokenSet(content) {
+  return new Set(content.match(/\w+/g) || []);
+}
+
+/**
+ * Jaccard similarity |A ∩ B| / |A ∪ B| of two token sets.
+ * Iterates the smaller set; membership tests are native Set lookups.
+ */
+function jaccardSimilarity(a, b) {
+  if (!a.size || !b.size) {
+    return a.size === b.size ? 1 : 0;
+  }
+
+  const [small, large] = a.size <= b.size ? [a, b] : [b, a];
+  let intersection = 0;
+  for (const token of small) {
+    if (large.has(token)) {
+      intersection++;
+    }
+  }
+  return intersection / (a.size + b.size - intersection);
+}
+
+/**
+ * Load the parsed-sessions cache: filename -> { mtimeMs, size, memories }.
+ * Lets repeated syntheses skip re-parsing unchanged session files.
+ */
+function loadSessionsCache(synthesisDir) {
+  const cacheFile = path.join(synthesisDir, 'sessions-cache.json');
+  try {
+    const cache = JSON.parse(fs.readFileSync(cacheFile));
+    if (cache && typeof cache === 'object' && !Array.isArray(cache)) {
+      return cache;
+    }
+  } catch {
+    // Missing, corrupt or unreadable cache — rebuild from scratch
+  }
+  return {};
+}
+
+/**
+ * Persist the parsed-sessions cache for the next synthesis run.
+ */
+function saveSessionsCache(synthesisDir, cache) {
+  try {
+    fs.mkdirSync(synthesisDir, { recursive: true });
+    fs.writeFileSync(path.join(synthesisDir, 'sessions-cache.json'), JSON.stringify(cache), 'utf-8');
+  } catch {
+    // Cache is an optimization only — ignore write failures
+  }
+}
+
+// Below this many uncached files the thread-pool overhead isn't worth
+// it and reads stay sequential.
+const PARALLEL_READ_THRESHOLD = 8;
+
+// Canonical category string instances. JSON parsing materializes a
+// fresh string per file, so map known categories back to one shared
+// instance — equality checks and key hashing in the grouping loops
+// then hit the fast identical-string path.
+const CANONICAL_CATEGORIES = new Map(CATEGORY_ORDER.map(c => [c, c]));
 
+function canonicalCategory(category) {
+  return CANONICAL_CATEGORIES.get(category) || category;
+}
+
+/**
+ * Parse one session file buffer into memory entries.
+ */
+function parseSessionBuffer(file, raw) {
+  const sessionData = JSON.parse(raw);
+  const timestamp = sessionData.timestamp || '';
+  const workingDir = sessionData.working_directory || '';
+
+  const fileMemories = [];
+  for (const mem of (sessionData.memories || [])) {
+    fileMemories.push({
+      category: canonicalCategory(mem.category || 'other'),
+      content: mem.content || '',
+      timestamp,
+      working_directory: workingDir,
+      source_file: file
+    });
+  }
+  return fileMemories;
+}
+
+/**
+ * Load all session memory files.
+ * Unchanged files (same mtime and size) are served from the cache
+ * instead of being re-read and re-parsed; when many files miss the
+ * cache, their reads are overlapped on the libuv thread pool.
+ */
+async function loadSessionMemories(sessionsDir, cache = {}, sinceMs = 0) {
   if (!fs.existsSync(sessionsDir)) {
-    return memories;
+    return [];
   }
 
   const files = fs.readdirSync(sessionsDir).filter(f => f.startsWith('session_') && f.endsWith('.json'));
 
-  for (const file of files) {
+  // Rebuild the cache with only files that still exist, so deleted
+  // sessions don't accumulate stale entries.
+  const freshCache = {};
+
+  // Resolve cache hits first; collect the misses for reading
+  const perFile = new Array(files.length).fill(null);
+  const misses = [];
+
+  for (let i = 0; i < files.length; i++) {
+    const file = files[i];
+    const filePath = path.join(sessionsDir, file);
     try {
-      const raw = fs.readFileSync(path.join(sessionsDir, file), 'utf-8');
-      const sessionData = JSON.parse(raw);
-      const timestamp = sessionData.timestamp || '';
-      const workingDir = sessionData.working_directory || '';
-
-      for (const mem of (sessionData.memories || [])) {
-        memories.push({
-          category: mem.category || 'other',
-          content: mem.content || '',
-          timestamp,
-          working_directory: workingDir,
-          source_file: file
-        });
+      const stats = fs.statSync(filePath);
+      const cached = cache[file];
+      const cacheValid = cached && cached.mtimeMs === stats.mtimeMs && cached.size === stats.size &&
+          Array.isArray(cached.memories);
+
+      // Files not modified since the watermark are already folded into
+      // the persisted synthesis state — keep their cache entry alive
+      // but don't reload their memories
+      if (sinceMs && stats.mtimeMs <= sinceMs) {
+        if (cacheValid) {
+          freshCache[file] = cached;
+        }
+        continue;
+      }
+
+      if (cacheValid) {
+        freshCache[file] = cached;
+        perFile[i] = cached.memories;
+      } else {
+        misses.push({ file, index: i, filePath, stats });
       }
     } catch (e) {
       process.stderr.write(`Warning: Could not load ${file}: ${e.message}\n`);
     }
   }
 
+  // On Linux, read cache misses in inode order: inode numbers roughly
+  // track physical layout, so on spinning disks this turns random head
+  // seeks into a forward sweep. On SSDs the sort is essentially free.
+  // Output order is unaffected — results land by directory index.
+  if (process.platform === 'linux' && misses.length > 1) {
+    misses.sort((a, b) => a.stats.ino - b.stats.ino);
+  }
+
+  const loadMiss = (miss, raw) => {
+    const fileMemories = parseSessionBuffer(miss.file, raw);
+    freshCache[miss.file] = { mtimeMs: miss.stats.mtimeMs, size: miss.stats.size, memories: fileMemories };
+    perFile[miss.index] = fileMemories;
+  };
+
+  if (misses.length > PARALLEL_READ_THRESHOLD) {
+    await Promise.all(misses.map(async miss => {
+      try {
+        loadMiss(miss, await fs.promises.readFile(miss.filePath));
+      } catch (e) {
+        process.stderr.write(`Warning: Could not load ${miss.file}: ${e.message}\n`);
+      }
+    }));
+  } else {
+    for (const miss of misses) {
+      try {
+        loadMiss(miss, fs.readFileSync(miss.filePath));
+      } catch (e) {
+        process.stderr.write(`Warning: Could not load ${miss.file}: ${e.message}\n`);
+      }
+    }
+  }
+
+  // Flatten in directory order so results are deterministic
+  const memories = [];
+  for (const fileMemories of perFile) {
+    if (fileMemories) {
+      memories.push(...fileMemories);
+    }
+  }
+
+  // Swap cache contents in place so the caller's reference stays valid
+  for (const key of Object.keys(cache)) delete cache[key];
+  Object.assign(cache, freshCache);
+
   return memories;
 }
 
@@ -86,21 +251,25 @@ function deduplicateMemories(memories, maxPerCategory) {
       return tb.localeCompare(ta);
     });
 
-    const seenContent = [];
+    // Normalize every content string exactly once, up front, rather
+    // than inside the dedup loop
+    const items = sorted.map(mem => [mem, mem.content.toLowerCase().trim()]);
+
+    const seenExact = new Set();
+    const keptTokenSets = [];
     const uniqueMems = [];
 
-    for (const mem of sorted) {
-      const content = mem.content.toLowerCase().trim();
+    for (const [mem, content] of items) {
+      // Exact match is a set lookup; near-duplicates are caught by
+      // token-set Jaccard overlap against everything kept so far, which
+      // also handles small edits that substring checks missed
+      let isDuplicate = seenExact.has(content);
+      let tokens = null;
 
-      // Check for exact match or substring overlap
-      let isDuplicate = false;
-      for (const seen of seenContent) {
-        if (content === seen) {
-          isDuplicate = true;
-          break;
-        }
-        if (content.length > 20 && seen.length > 20) {
-          if (content.includes(seen) || seen.includes(content)) {
+      if (!isDuplicate) {
+        tokens = tokenSet(content);
+        for (const kept of keptTokenSets) {
+          if (jaccardSimilarity(tokens, kept) >= JACCARD_THRESHOLD) {
             isDuplicate = true;
             break;
           }
@@ -108,7 +277,8 @@ function deduplicateMemories(memories, maxPerCategory) {
       }
 
       if (!isDuplicate) {
-        seenContent.push(content);
+        seenExact.add(content);
+        keptTokenSets.push(tokens);
         uniqueMems.push(mem);
         if (uniqueMems.length >= maxPerCategory) {
           break;
@@ -129,12 +299,16 @@ function generateMemoryMd(memoriesByCategory, synthesisTime) {
   const pad = n => String(n).padStart(2, '0');
   const timeStr = `${synthesisTime.getFullYear()}-${pad(synthesisTime.getMonth() + 1)}-${pad(synthesisTime.getDate())} ${pad(synthesisTime.getHours())}:${pad(synthesisTime.getMinutes())}`;
 
-  const lines = [
-    '# Claude Code Memory',
-    '',
-    `*Last synthesized: ${timeStr}*`,
-    ''
-  ];
+  // Build one contiguous string instead of accumulating a lines array
+  // and joining it — no per-line array slots, no second full-size copy
+  let md = `# Claude Code Memory\n\n*Last synthesized: ${timeStr}*\n`;
+
+  const writeSection = (category, mems) => {
+    md += `\n## ${formatCategoryName(category)}\n`;
+    for (const mem of mems) {
+      md += `- ${mem.content}\n`;
+    }
+  };
 
   // Add known categories first in order
   const addedCategories = new Set();
@@ -142,11 +316,7 @@ function generateMemoryMd(memoriesByCategory, synthesisTime) {
   for (const category of CATEGORY_ORDER) {
     const mems = memoriesByCategory[category];
     if (mems && mems.length) {
-      lines.push(`## ${formatCategoryName(category)}`);
-      for (const mem of mems) {
-        lines.push(`- ${mem.content}`);
-      }
-      lines.push('');
+      writeSection(category, mems);
       addedCategories.add(category);
     }
   }
@@ -154,63 +324,123 @@ function generateMemoryMd(memoriesByCategory, synthesisTime) {
   // Add any remaining categories
   for (const [category, mems] of Object.entries(memoriesByCategory)) {
     if (!addedCategories.has(category) && mems && mems.length) {
-      lines.push(`## ${formatCategoryName(category)}`);
-      for (const mem of mems) {
-        lines.push(`- ${mem.content}`);
-      }
-      lines.push('');
+      writeSection(category, mems);
     }
   }
 
-  return lines.join('\n');
+  return md;
 }
 
 /**
  * Remove session files older than specified days.
  */
 function cleanupOldSessions(sessionsDir, days) {
-  if (!fs.existsSync(sessionsDir)) {
+  // Filenames embed the timestamp as session_YYYYMMDD_HHMMSS.json, a
+  // format that sorts chronologically — so the age check is a plain
+  // string comparison against the cutoff stamp, with no date parsing
+  const cutoffStamp = formatTimestamp(new Date(Date.now() - days * 24 * 60 * 60 * 1000));
+  let removed = 0;
+
+  // Stream entries instead of materializing a filtered file list; the
+  // age comes from the filename so no per-file stat is needed either
+  let dir;
+  try {
+    dir = fs.opendirSync(sessionsDir);
+  } catch {
     return 0;
   }
 
-  const cutoff = new Date(Date.now() - days * 24 * 60 * 60 * 1000);
-  let removed = 0;
+  try {
+    let entry;
+    while ((entry = dir.readSync()) !== null) {
+      const name = entry.name;
+      if (!name.startsWith('session_') || !name.endsWith('.json')) {
+        continue;
+      }
 
-  const files = fs.readdirSync(sessionsDir).filter(f => f.startsWith('session_') && f.endsWith('.json'));
+      const stamp = name.slice(8, -5);
+      if (stamp.length !== 15 || stamp[8] !== '_') {
+        continue;
+      }
 
-  for (const file of files) {
-    try {
-      // Parse timestamp from filename: session_YYYYMMDD_HHMMSS.json
-      const name = file.replace('session_', '').replace('.json', '');
-      const parts = name.split('_');
-      if (parts.length === 2) {
-        const dateStr = parts[0];
-        const timeStr = parts[1];
-        const year = parseInt(dateStr.substring(0, 4), 10);
-        const month = parseInt(dateStr.substring(4, 6), 10) - 1;
-        const day = parseInt(dateStr.substring(6, 8), 10);
-        const hour = parseInt(timeStr.substring(0, 2), 10);
-        const minute = parseInt(timeStr.substring(2, 4), 10);
-        const second = parseInt(timeStr.substring(4, 6), 10);
-        const fileDate = new Date(year, month, day, hour, minute, second);
-
-        if (fileDate < cutoff) {
-          fs.unlinkSync(path.join(sessionsDir, file));
+      if (stamp < cutoffStamp) {
+        try {
+          fs.unlinkSync(path.join(sessionsDir, name));
           removed++;
+        } catch {
+          // Skip files we can't remove
         }
       }
-    } catch {
-      // Skip files we can't parse
     }
+  } finally {
+    dir.closeSync();
   }
 
   return removed;
 }
 
 /**
- * Save synthesis state for checking intervals.
+ * Load the persisted synthesis state (the deduplicated per-category
+ * memories from the previous run plus the incremental watermark), or
+ * null if no valid state exists.
+ */
+function loadSynthesisState(synthesisDir) {
+  // A missing last-synthesis.json means the memories were reset (the
+  // reset skill deletes it) — discard any surviving state instead of
+  // carrying deleted memories back into MEMORY.md
+  if (!fs.existsSync(path.join(synthesisDir, 'last-synthesis.json'))) {
+    return null;
+  }
+
+  try {
+    const state = JSON.parse(fs.readFileSync(path.join(synthesisDir, 'state.json')));
+    if (state && typeof state === 'object' &&
+        state.memories_by_category && typeof state.memories_by_category === 'object' &&
+        Object.values(state.memories_by_category).every(Array.isArray)) {
+      return state;
+    }
+  } catch {
+    // Missing or invalid state — fall back to a full synthesis
+  }
+  return null;
+}
+
+/**
+ * True when some session file has been modified after the watermark.
+ */
+function hasNewSessions(sessionsDir, watermarkMs) {
+  let dir;
+  try {
+    dir = fs.opendirSync(sessionsDir);
+  } catch {
+    return false;
+  }
+
+  try {
+    let entry;
+    while ((entry = dir.readSync()) !== null) {
+      if (!entry.name.startsWith('session_') || !entry.name.endsWith('.json')) {
+        continue;
+      }
+      try {
+        if (fs.statSync(path.join(sessionsDir, entry.name)).mtimeMs > watermarkMs) {
+          return true;
+        }
+      } catch {
+        // Deleted mid-scan — not new
+      }
+    }
+  } finally {
+    dir.closeSync();
+  }
+  return false;
+}
+
+/**
+ * Save synthesis state: last-synthesis.json for interval checking and
+ * state.json with the deduplicated memories for incremental runs.
  */
-function saveSynthesisState(synthesisDir, synthesisTime) {
+function saveSynthesisState(synthesisDir, synthesisTime, watermarkMs, memoriesByCategory) {
   fs.mkdirSync(synthesisDir, { recursive: true });
   const stateFile = path.join(synthesisDir, 'last-synthesis.json');
   const state = {
@@ -218,9 +448,16 @@ function saveSynthesisState(synthesisDir, synthesisTime) {
     version: '1.0'
   };
   fs.writeFileSync(stateFile, JSON.stringify(state, null, 2), 'utf-8');
+
+  const fullState = {
+    last_synthesis: synthesisTime.toISOString(),
+    watermark_ms: watermarkMs,
+    memories_by_category: memoriesByCategory
+  };
+  fs.writeFileSync(path.join(synthesisDir, 'state.json'), JSON.stringify(fullState), 'utf-8');
 }
 
-function main() {
+async function main() {
   // Parse arguments
   const args = process.argv.slice(2);
   const force = args.includes('--force');
@@ -236,24 +473,51 @@ function main() {
   console.log('Claude Code Memory Synthesis');
   console.log('='.repeat(40));
 
-  // Load all session memories
-  console.log('Loading session memories...');
-  const memories = loadSessionMemories(sessionsDir);
-  console.log(`  Found ${memories.length} memories from sessions`);
-
-  if (!memories.length) {
-    console.log('  No memories to synthesize');
-    return 0;
+  // Previous state lets us load only sessions newer than the watermark
+  // and merge them into the already-deduplicated memories
+  const state = loadSynthesisState(synthesisDir);
+  const watermarkMs = state ? (state.watermark_ms || 0) : 0;
+  const carried = [];
+  if (state) {
+    for (const mems of Object.values(state.memories_by_category)) {
+      carried.push(...mems);
+    }
   }
 
-  // Deduplicate memories
-  console.log('Deduplicating memories...');
-  const maxPerCategory = config.max_memories_per_category || 15;
-  const memoriesByCategory = deduplicateMemories(memories, maxPerCategory);
+  let memoriesByCategory;
+  let loadStartMs = watermarkMs;
+
+  if (force && state && watermarkMs && !hasNewSessions(sessionsDir, watermarkMs)) {
+    // Forced regeneration with nothing new: the persisted state is
+    // already deduplicated, so skip the whole load + dedup pipeline
+    console.log('No new sessions — regenerating from synthesis state');
+    memoriesByCategory = state.memories_by_category;
+  } else {
+    // Load new session memories (unchanged files come from the parse cache)
+    console.log('Loading session memories...');
+    loadStartMs = Date.now();
+    const sessionsCache = loadSessionsCache(synthesisDir);
+    const memories = await loadSessionMemories(sessionsDir, sessionsCache, watermarkMs);
+    saveSessionsCache(synthesisDir, sessionsCache);
+    console.log(`  Found ${memories.length} new memories from sessions`);
+    if (carried.length) {
+      console.log(`  Carrying ${carried.length} memories from previous synthesis`);
+    }
+
+    if (!memories.length && !carried.length) {
+      console.log('  No memories to synthesize');
+      return 0;
+    }
 
-  const totalUnique = Object.values(memoriesByCategory).reduce((sum, mems) => sum + mems.length, 0);
-  const categoryCount = Object.keys(memoriesByCategory).length;
-  console.log(`  ${totalUnique} unique memories across ${categoryCount} categories`);
+    // Deduplicate the carried state plus the new memories
+    console.log('Deduplicating memories...');
+    const maxPerCategory = config.max_memories_per_category || 15;
+    memoriesByCategory = deduplicateMemories(carried.concat(memories), maxPerCategory);
+
+    const totalUnique = Object.values(memoriesByCategory).reduce((sum, mems) => sum + mems.length, 0);
+    const categoryCount = Object.keys(memoriesByCategory).length;
+    console.log(`  ${totalUnique} unique memories across ${categoryCount} categories`);
+  }
 
   // Generate MEMORY.md
   console.log('Generating MEMORY.md...');
@@ -261,11 +525,20 @@ function main() {
   const memoryContent = generateMemoryMd(memoriesByCategory, synthesisTime);
 
   const memoryFile = path.join(memoryDir, 'MEMORY.md');
-  fs.writeFileSync(memoryFile, memoryContent, 'utf-8');
+  // Encode once and write the whole file with a single write syscall
+  // (open with O_WRONLY|O_CREAT|O_TRUNC, no buffered text layer)
+  const encoded = Buffer.from(memoryContent, 'utf-8');
+  const fd = fs.openSync(memoryFile, 'w', 0o644);
+  try {
+    fs.writeSync(fd, encoded);
+  } finally {
+    fs.closeSync(fd);
+  }
   console.log(`  Written to ${memoryFile}`);
 
-  // Save synthesis state
-  saveSynthesisState(synthesisDir, synthesisTime);
+  // Save synthesis state; the watermark is the load start time so
+  // sessions written while we ran are picked up next time
+  saveSynthesisState(synthesisDir, synthesisTime, loadStartMs, memoriesByCategory);
 
   // Cleanup old sessions
   if (!noCleanup) {
@@ -293,4 +566,7 @@ function main() {
   return 0;
 }
 
-process.exit(main());
+main().then(code => process.exit(code)).catch(e => {
+  process.stderr.write(`Synthesis failed: ${e.message}\n`);
+  process.exit(1);
+});